@@ -0,0 +1,337 @@
+"""
+Batch Campaign Data Validation Function
+
+This module validates many campaigns at once for backfills and streaming batches.
+Field checks (required, type, format) still run per record through the compiled
+schema, but the numeric business rules and anomalies run as a single NumPy kernel
+over all well-typed records that emits one bitmask per row. Messages are only
+built for the rows whose bitmask is non-zero, and campaign_batch_validity skips
+building them altogether.
+
+validate_campaign_columns takes the data already in columnar form (NumPy arrays,
+e.g. from a pyarrow Table or pandas DataFrame) and returns the bitmasks directly.
+"""
+
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from src.functions.validateCampaignData import (
+    HIGH_SPEND_THRESHOLD,
+    KNOWN_SOURCES,
+    MAX_CTR_PERCENT,
+    MAX_DATE_AGE_DAYS,
+    CampaignData,
+    _COMPILED_CHECKS,
+    _COMPILED_RULES,
+    _COMPILED_WARNINGS,
+    _FIELD_KINDS,
+    _MISSING,
+    _REQUIRED_SET,
+    _check_null_metrics,
+    _check_required,
+    _field_checks,
+    _format,
+    _now_iso,
+    _parse_ymd,
+    _passes,
+    _reference_date,
+    _run_checks,
+    _run_validator,
+    _source_key,
+)
+
+logger = logging.getLogger(__name__)
+
+# One bit per compiled check: business rules first, then warnings (same order as the programs)
+_BIT_CHECKS = _COMPILED_RULES + _COMPILED_WARNINGS
+_ERROR_BITS = (1 << len(_COMPILED_RULES)) - 1
+
+# Column input only: a field check (required, type, range, format) failed for the row
+FIELD_ERROR_FLAG = 1 << len(_BIT_CHECKS)
+# Flags that make a row invalid; any other bit set is a warning
+ERROR_FLAGS = _ERROR_BITS | FIELD_ERROR_FLAG
+
+
+# Largest count for which clicks * 100 and impressions * MAX_CTR_PERCENT both fit in int64
+_CTR_INT64_LIMIT = int(np.iinfo(np.int64).max // max(100, MAX_CTR_PERCENT))
+
+
+def _numeric_rule_kernel(spend: np.ndarray, impressions: np.ndarray, clicks: np.ndarray,
+                         conversions: np.ndarray, has_conversions: np.ndarray,
+                         revenue: np.ndarray, has_revenue: np.ndarray,
+                         days_old: np.ndarray, known_source: np.ndarray) -> np.ndarray:
+    """Return an int32 bitmask per row; bit k set means _BIT_CHECKS[k] fails for that row."""
+    # CTR > limit  <=>  clicks * 100 > limit * impressions: integer compares, no division or zero guard.
+    # The products can overflow int64 for huge counts; those (rare) rows compare as Python ints.
+    has_impressions = impressions > 0
+    exact = (impressions <= _CTR_INT64_LIMIT) & (clicks <= _CTR_INT64_LIMIT)
+    high_ctr = np.empty(len(clicks), dtype=bool)
+    high_ctr[exact] = clicks[exact] * 100 > impressions[exact] * MAX_CTR_PERCENT
+    if not exact.all():
+        wide = ~exact
+        high_ctr[wide] = (clicks[wide].astype(object) * 100
+                          > impressions[wide].astype(object) * MAX_CTR_PERCENT)
+    failed = (
+        # Business rules
+        clicks > impressions,
+        has_conversions & (conversions > clicks),
+        (impressions == 0) & (clicks > 0),
+        has_impressions & high_ctr,
+        # Anomalies
+        days_old > MAX_DATE_AGE_DAYS,
+        has_impressions & (clicks == 0),
+        spend > HIGH_SPEND_THRESHOLD,
+        has_conversions & (conversions > 0) & (~has_revenue | (revenue == 0)),
+        ~known_source,
+    )
+    flags = np.zeros(len(spend), dtype=np.int32)
+    for bit, mask in enumerate(failed):
+        flags |= mask.astype(np.int32) << bit
+    return flags
+
+
+def _numeric_column(values: List[Any], dtype: type) -> np.ndarray:
+    """Values as a dtype column, or as an object column of Python numbers if one doesn't fit."""
+    try:
+        return np.fromiter(values, dtype=dtype, count=len(values))
+    except OverflowError:
+        # Python ints accept any size (e.g. 10**19 impressions); the kernel's compares work
+        # element-wise on object columns too, with the same results as the scalar checks
+        return np.array(values, dtype=object)
+
+
+def _columns(records: List[dict], rows: np.ndarray, today: int) -> Dict[str, np.ndarray]:
+    """Stack the numeric fields of the given rows into NumPy columns (SoA); today is an ordinal."""
+    selected = [records[i] for i in rows]
+    n = len(selected)
+    conversions = [r.get("conversions", _MISSING) for r in selected]
+    revenue = [r.get("revenue", _MISSING) for r in selected]
+    return {
+        "spend": _numeric_column([r["spend"] for r in selected], np.float64),
+        "impressions": _numeric_column([r["impressions"] for r in selected], np.int64),
+        "clicks": _numeric_column([r["clicks"] for r in selected], np.int64),
+        "has_conversions": np.fromiter((v is not _MISSING for v in conversions), dtype=bool, count=n),
+        "conversions": _numeric_column([0 if v is _MISSING else v for v in conversions], np.int64),
+        "has_revenue": np.fromiter((v is not _MISSING for v in revenue), dtype=bool, count=n),
+        "revenue": _numeric_column([0.0 if v is _MISSING else v for v in revenue], np.float64),
+        "days_old": np.fromiter((today - _parse_ymd(r["date"]).toordinal() for r in selected),
+                                dtype=np.int64, count=n),
+        "known_source": np.fromiter((r["source"] in KNOWN_SOURCES for r in selected),
+                                    dtype=bool, count=n),
+    }
+
+
+def _decode(flags: np.ndarray, rows: np.ndarray, records: List[dict],
+            errors: List[List[str]], warnings: List[List[str]]) -> None:
+    """Build messages for flagged rows; warnings only count for rows that broke no rule."""
+    for j in np.flatnonzero(flags):
+        i, bits = rows[j], int(flags[j])
+        if bits & _ERROR_BITS:
+            out, bits = errors[i], bits & _ERROR_BITS
+        else:
+            out = warnings[i]
+        record = records[i]
+        for bit, (field, check) in enumerate(_BIT_CHECKS):
+            if bits >> bit & 1:
+                # The scalar check has the final say; a bit it doesn't confirm adds no message
+                failure = check(record.get(field, _MISSING), record)
+                if failure:
+                    out.append(_format(failure))
+
+
+def _validate_rows(records: List[dict], errors: List[List[str]], warnings: List[List[str]],
+                   today: date) -> None:
+    """Fill the per-record message lists: field checks per record, then the rule kernel."""
+    # Business rules and anomalies only apply to rows whose fields type-checked
+    typed_rows: List[int] = []
+    with _reference_date(today):
+        for i, record in enumerate(records):
+            out = errors[i]
+            if (_check_null_metrics(record, out)
+                    and _check_required(record, out)
+                    and _run_checks(_field_checks(_source_key(record)), record, out)):
+                typed_rows.append(i)
+
+        typed = np.array(typed_rows, dtype=np.intp)
+        if typed.size:
+            flags = _numeric_rule_kernel(**_columns(records, typed, today.toordinal()))
+            _decode(flags, typed, records, errors, warnings)
+
+
+def validate_campaign_batch(records: List[dict], *, now: Optional[datetime] = None) -> List[dict]:
+    """
+    Validates a batch of campaigns with the same rules as validate_campaign_data.
+
+    Args:
+        records: List of campaign dictionaries (see validate_campaign_data for the structure)
+        now: Reference time for the date rules; the clock is read once per batch when omitted
+
+    Returns:
+        List of validation result dictionaries, one per record and in the same order,
+        each shaped like the result of validate_campaign_data.
+    """
+    today = now.date() if now else date.today()
+    errors: List[List[str]] = [[] for _ in records]
+    warnings: List[List[str]] = [[] for _ in records]
+
+    if len(records) == 1:
+        # A single record gains nothing from the kernel; take the scalar path
+        _run_validator(records[0], errors[0], warnings[0], today)
+    else:
+        _validate_rows(records, errors, warnings, today)
+
+    if logger.isEnabledFor(logging.INFO):
+        invalid = sum(1 for e in errors if e)
+        logger.info("Validated batch of %d campaign(s): %d invalid", len(records), invalid)
+
+    validated_at = _now_iso()
+    return [
+        {
+            "valid": not errors[i],
+            "errors": errors[i],
+            "warnings": warnings[i],
+            "campaign_id": record.get("campaign_id"),
+            "validated_at": validated_at
+        }
+        for i, record in enumerate(records)
+    ]
+
+
+def campaign_batch_validity(records: List[dict], *, now: Optional[datetime] = None) -> np.ndarray:
+    """
+    Computes which campaigns in a batch are valid without building any messages.
+
+    Args:
+        records: List of campaign dictionaries (see validate_campaign_data for the structure)
+        now: Reference time for the date rules; the clock is read once per batch when omitted
+
+    Returns:
+        Boolean NumPy array, True where validate_campaign_data would report the record
+        valid. Validate the rows you need messages for with validate_campaign_data.
+    """
+    today = now.date() if now else date.today()
+    with _reference_date(today):
+        # A record missing a required field is rejected by the subset test alone
+        valid = np.fromiter(
+            (_REQUIRED_SET <= r.keys() and _passes(_field_checks(_source_key(r)), r) for r in records),
+            dtype=bool, count=len(records),
+        )
+    typed = np.flatnonzero(valid)
+    if typed.size:
+        flags = _numeric_rule_kernel(**_columns(records, typed, today.toordinal()))
+        valid[typed] = (flags & _ERROR_BITS) == 0
+    return valid
+
+
+# Numeric schema fields (all fed to the kernel) -> whether they must hold integers
+_NUMERIC_FIELDS = {name: kind is int for name, kind in _FIELD_KINDS.items() if kind in (int, float)}
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _check_column(name: str, check: Any, column: Optional[Any], n: int,
+                  today: int) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+    """
+    Validate one column; returns (row passed field check, row has a value, kernel values).
+
+    Typed numeric, datetime64 and unicode columns are checked with array ops; object
+    columns fall back to the compiled per-value field check. Nulls (None/NaN/NaT) mean
+    the value is absent. Kernel values are date ordinals for 'date', numbers for
+    numeric fields and None for the other string fields.
+    """
+    required = CampaignData.model_fields[name].is_required()
+    integer = _NUMERIC_FIELDS.get(name)
+    dtype = np.int64 if integer or name == "date" else np.float64
+    fill = today if name == "date" else 0
+    kernel_input = integer is not None or name == "date"
+
+    if column is None:
+        values = np.full(n, fill, dtype=dtype) if kernel_input else None
+        return np.full(n, not required), np.zeros(n, dtype=bool), values
+
+    arr = np.asarray(column)
+    kind = arr.dtype.kind
+
+    if integer is not None and kind in "iuf":
+        # Nullable integer columns arrive as float64 with NaN; accept integral values there
+        present = ~np.isnan(arr) if kind == "f" else np.ones(n, dtype=bool)
+        safe = np.where(present, arr, 0)
+        ok = (safe >= 0) & (present | (not required))
+        if integer and kind == "f":
+            # inf == floor(inf), so rule out non-finite values explicitly
+            ok &= np.isfinite(safe) & (safe == np.floor(safe))
+        if integer and kind != "i" and n and not safe.max() < 2**63:
+            # astype(int64) would wrap values from 2**63 up; keep them as Python numbers
+            return ok, present, safe.astype(object)
+        return ok, present, safe.astype(dtype)
+
+    if name == "date" and kind == "M":
+        days = arr.astype("datetime64[D]")
+        present = ~np.isnat(days)
+        ordinals = np.where(present, days.astype(np.int64) + _EPOCH_ORDINAL, today)
+        return present & (ordinals <= today), present, ordinals
+
+    if kind == "U" and not kernel_input:
+        return np.ones(n, dtype=bool), np.ones(n, dtype=bool), None
+
+    items = [_MISSING if v is None else v for v in arr.tolist()]
+    ok = np.array([check(v, None) is None for v in items], dtype=bool)
+    present = np.array([v is not _MISSING for v in items], dtype=bool)
+    if not kernel_input:
+        return ok, present, None
+    usable = ok & present
+    if name == "date":
+        values = [_parse_ymd(v).toordinal() if good else fill for v, good in zip(items, usable)]
+    else:
+        values = [v if good else fill for v, good in zip(items, usable)]
+    return ok, present, _numeric_column(values, dtype)
+
+
+def validate_campaign_columns(columns: Mapping[str, Any], *,
+                              now: Optional[datetime] = None) -> np.ndarray:
+    """
+    Validates campaigns supplied as columns, e.g. {name: table[name].to_numpy()}.
+
+    Only the base CampaignData schema is applied (no source-specific checks). Integer
+    fields may arrive as float columns with NaN for nulls; integral values are accepted.
+
+    Args:
+        columns: Mapping of field name to a 1-D array-like, all of the same length
+        now: Reference time for the date rules; the clock is read once when omitted
+
+    Returns:
+        int32 NumPy array of flags per row. Bit k means the k-th business rule (first
+        the rules, then the anomaly warnings) failed; FIELD_ERROR_FLAG means a field
+        check failed. A row is valid when (flags & ERROR_FLAGS) == 0, and warning bits
+        are only reported for valid rows.
+    """
+    n = len(next(iter(columns.values()))) if columns else 0
+    reference = now.date() if now else date.today()
+    today = reference.toordinal()
+    ok = np.ones(n, dtype=bool)
+    cols: Dict[str, np.ndarray] = {}
+    with _reference_date(reference):
+        for name, check in _COMPILED_CHECKS:
+            field_ok, present, values = _check_column(name, check, columns.get(name), n, today)
+            ok &= field_ok
+            if name == "date":
+                cols["days_old"] = today - values
+            elif values is not None:
+                cols[name] = values
+                cols["has_" + name] = present
+
+    kernel_args = {k: cols[k] for k in ("spend", "impressions", "clicks", "conversions",
+                                         "revenue", "days_old")}
+    source = columns.get("source")
+    # Rows with a missing or non-string source already failed their field check
+    known_source = (np.ones(n, dtype=bool) if source is None else np.fromiter(
+        (type(v) is str and v in KNOWN_SOURCES for v in np.asarray(source).tolist()),
+        dtype=bool, count=n,
+    ))
+    flags = _numeric_rule_kernel(has_conversions=cols["has_conversions"],
+                                 has_revenue=cols["has_revenue"], known_source=known_source,
+                                 **kernel_args)
+    flags = np.where(flags & _ERROR_BITS, flags & _ERROR_BITS, flags)
+    return np.where(ok, flags, FIELD_ERROR_FLAG).astype(np.int32)
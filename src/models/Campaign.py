@@ -5,9 +5,14 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Campaign:
-    """Represents a marketing campaign from various sources."""
+    """Represents a marketing campaign from various sources.
+
+    Slotted: instances carry no per-object __dict__, which matters when a sync holds
+    many of them. The derived metrics are plain properties rather than cached values,
+    since campaigns are updated in place (MarketingDataService.update_campaign).
+    """
     
     id: str
     name: str
@@ -23,10 +28,12 @@ class Campaign:
     updated_at: datetime = None
     
     def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.utcnow()
-        if self.updated_at is None:
-            self.updated_at = datetime.utcnow()
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.utcnow()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
     
     @property
     def ctr(self) -> float:
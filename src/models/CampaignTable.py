@@ -0,0 +1,118 @@
+"""Columnar campaign storage for bulk analytics."""
+
+from dataclasses import dataclass, fields
+from typing import Iterable, List
+
+import numpy as np
+
+from src.models.Campaign import Campaign
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray, scale: float = 1.0) -> np.ndarray:
+    """Element-wise numerator / denominator * scale, 0.0 where the denominator is 0."""
+    out = np.zeros(len(numerator), dtype=np.float64)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out * scale if scale != 1.0 else out
+
+
+_INT32 = np.iinfo(np.int32)
+
+
+def _counts(values: Iterable[int], n: int) -> np.ndarray:
+    """Count column as int32, or int64 if a value is outside the int32 range."""
+    column = np.fromiter(values, dtype=np.int64, count=n)
+    if n and (column.min() < _INT32.min or column.max() > _INT32.max):
+        return column
+    return column.astype(np.int32)
+
+
+@dataclass
+class CampaignTable:
+    """Campaigns stored as one NumPy column per field (SoA) instead of one object each.
+
+    Metric methods compute the Campaign properties for every row at once. Revenue is
+    float64 with NaN where a campaign has none; dates are datetime64[us]. Count columns
+    are int32 (half the bytes for every pass), or int64 when a value doesn't fit; sum
+    them with dtype=np.int64. Money stays float64, as float32 can't represent every
+    cent above 2**24 cents (~$167k).
+    """
+
+    id: np.ndarray
+    name: np.ndarray
+    source: np.ndarray
+    date: np.ndarray
+    spend: np.ndarray
+    impressions: np.ndarray
+    clicks: np.ndarray
+    conversions: np.ndarray
+    revenue: np.ndarray
+    currency: np.ndarray
+
+    @classmethod
+    def from_campaigns(cls, campaigns: List[Campaign]) -> 'CampaignTable':
+        """Build a table from Campaign objects (row order is kept)."""
+        n = len(campaigns)
+        return cls(
+            id=np.array([c.id for c in campaigns], dtype=object),
+            name=np.array([c.name for c in campaigns], dtype=object),
+            source=np.array([c.source for c in campaigns], dtype=object),
+            date=np.array([c.date for c in campaigns], dtype="datetime64[us]"),
+            spend=np.fromiter((c.spend for c in campaigns), dtype=np.float64, count=n),
+            impressions=_counts((c.impressions for c in campaigns), n),
+            clicks=_counts((c.clicks for c in campaigns), n),
+            conversions=_counts((c.conversions for c in campaigns), n),
+            revenue=np.fromiter(
+                (np.nan if c.revenue is None else c.revenue for c in campaigns),
+                dtype=np.float64, count=n,
+            ),
+            currency=np.array([c.currency for c in campaigns], dtype=object),
+        )
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def take(self, rows: np.ndarray) -> 'CampaignTable':
+        """New table with the given rows (indices or a slice), in that order."""
+        return CampaignTable(**{f.name: getattr(self, f.name)[rows] for f in fields(self)})
+
+    def sorted_by_date(self) -> 'CampaignTable':
+        """New table ordered by date (stable, so same-day rows keep their order)."""
+        return self.take(np.argsort(self.date, kind="stable"))
+
+    def row(self, i: int) -> Campaign:
+        """Materialize row i as a Campaign (timestamps aren't stored, so they start fresh)."""
+        revenue = self.revenue[i]
+        return Campaign(
+            id=self.id[i],
+            name=self.name[i],
+            source=self.source[i],
+            date=self.date[i].item(),
+            spend=float(self.spend[i]),
+            impressions=int(self.impressions[i]),
+            clicks=int(self.clicks[i]),
+            conversions=int(self.conversions[i]),
+            revenue=None if np.isnan(revenue) else float(revenue),
+            currency=self.currency[i],
+        )
+
+    def ctr(self) -> np.ndarray:
+        """Click-Through Rate per row (0.0 without impressions)."""
+        return _ratio(self.clicks, self.impressions, 100.0)
+
+    def conversion_rate(self) -> np.ndarray:
+        """Conversion Rate per row (0.0 without clicks)."""
+        return _ratio(self.conversions, self.clicks, 100.0)
+
+    def roas(self) -> np.ndarray:
+        """Return on Ad Spend per row (NaN without spend or revenue)."""
+        out = np.full(len(self), np.nan)
+        np.divide(self.revenue, self.spend, out=out, where=self.spend != 0)
+        return out
+
+    def cpc(self) -> np.ndarray:
+        """Cost Per Click per row (0.0 without clicks)."""
+        return _ratio(self.spend, self.clicks)
+
+    def cpa(self) -> np.ndarray:
+        """Cost Per Acquisition per row (0.0 without conversions)."""
+        return _ratio(self.spend, self.conversions)
@@ -5,20 +5,115 @@ This service is responsible for fetching campaign data from various marketing
 platforms (Google Ads, Facebook Ads, etc.) and aggregating it for analytics.
 """
 
+import numpy as np
+import orjson
 import requests
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from src.models.Campaign import Campaign
+from src.models.CampaignTable import CampaignTable
 from src.models.DataSource import DataSource
 
 
+# (connect, read) timeouts for platform API calls, in seconds
+API_TIMEOUT = (3.05, 27)
+
+# Date ranges whose aggregate_metrics results are kept
+AGGREGATE_CACHE_SIZE = 128
+
+# API responses are cached in memory per source and day. Platforms keep revising the
+# last SETTLEMENT_DAYS days (today included), so those are fetched fresh on every sync;
+# earlier days are immutable and served from the cache until SETTLED_API_CACHE_TTL.
+API_CACHE_SIZE = 4096  # cached source-days
+SETTLED_API_CACHE_TTL = timedelta(days=30)
+SETTLEMENT_DAYS = 3
+
+
+def _create_session() -> requests.Session:
+    """HTTP session with pooled keep-alive connections and retries on transient errors."""
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"]
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry))
+    return session
+
+
+# Attributes update_campaign may set (Campaign is slotted, so nothing else can be)
+_CAMPAIGN_FIELDS = frozenset(f.name for f in fields(Campaign))
+
+
 class MarketingDataService:
     """Service for aggregating marketing campaign data from multiple sources."""
     
     def __init__(self):
+        self._version = 0  # Bumped on every change to the campaigns
+        self._agg_cache: Dict[Tuple[datetime, datetime, int], Dict] = {}
+        # (source type, account, start, end) -> (monotonic expiry, raw campaign rows)
+        self._api_cache: Dict[Tuple, Tuple[float, List[Dict]]] = {}
+        self._api_cache_lock = threading.Lock()
         self.campaigns = []  # In-memory storage of campaigns
         self.data_sources = self._load_data_sources()
+        # (source type, api key, account) -> (url, headers, base params)
+        self._request_templates: Dict[Tuple, Tuple[str, Dict, Dict]] = {}
+        self._session = _create_session()
+    
+    @property
+    def campaigns(self) -> Tuple[Campaign, ...]:
+        """
+        The synced campaigns, read-only so the lookup indexes can't go stale.
+        
+        Assign a new sequence to replace them; that rebuilds the indexes.
+        """
+        return self._campaigns
+    
+    @campaigns.setter
+    def campaigns(self, campaigns: Sequence[Campaign]) -> None:
+        # Copied, so later changes to the caller's list can't bypass the indexes either
+        self._campaigns = tuple(campaigns)
+        self._reindex()
+    
+    def _reindex(self) -> None:
+        """Rebuild the lookup indexes from self.campaigns."""
+        self._version += 1
+        # First campaign per id wins, as with a front-to-back scan (a range sync
+        # returns one row per campaign and day under the same id)
+        by_id: Dict[str, Campaign] = {}
+        by_source: Dict[str, List[Campaign]] = defaultdict(list)
+        for campaign in self._campaigns:
+            by_id.setdefault(campaign.id, campaign)
+            by_source[campaign.source].append(campaign)
+        self._by_id = by_id
+        self._by_source = dict(by_source)
+        self._spend_by_source = {
+            source: self._sum_spend(campaigns) for source, campaigns in self._by_source.items()
+        }
+        self._total_spend = sum(self._spend_by_source.values(), 0.0)
+        self._table: Optional[CampaignTable] = None
+    
+    def _columns(self) -> CampaignTable:
+        """Columnar (SoA) copy of the campaigns, sorted by date; rebuilt lazily after changes."""
+        if self._table is None:
+            self._table = CampaignTable.from_campaigns(self._campaigns).sorted_by_date()
+        return self._table
+    
+    @staticmethod
+    def _sum_spend(campaigns: List[Campaign]) -> float:
+        """Total spend of the campaigns, summed in list order."""
+        total = 0.0
+        for campaign in campaigns:
+            total += campaign.spend
+        return total
     
     def _load_data_sources(self) -> List[DataSource]:
         """Load configured data sources from storage."""
@@ -64,15 +159,24 @@ class MarketingDataService:
         print(f"Starting campaign sync for {start_date} to {end_date}")
         
         all_campaigns = []
+        active_sources = [source for source in self.data_sources if source.is_active]
+        if not active_sources:
+            self.campaigns = all_campaigns
+            return all_campaigns
         
-        # Process each data source
-        for source in self.data_sources:
-            if source.is_active:
+        # Fetch all sources concurrently (the calls are I/O bound); results are
+        # collected in source order so the campaign order doesn't depend on timing
+        with ThreadPoolExecutor(max_workers=len(active_sources)) as executor:
+            futures = []
+            for source in active_sources:
                 print(f"Syncing from {source.name} with API key: {source.api_key}")
-                
+                futures.append(executor.submit(
+                    self._fetch_campaigns_from_source, source, start_date, end_date
+                ))
+            
+            for source, future in zip(active_sources, futures):
                 try:
-                    campaigns = self._fetch_campaigns_from_source(source, start_date, end_date)
-                    all_campaigns.extend(campaigns)
+                    all_campaigns.extend(future.result())
                     source.update_last_sync()
                 except Exception as e:
                     print(f"Error syncing {source.name}: {e}")
@@ -100,91 +204,164 @@ class MarketingDataService:
         """
         campaigns = []
         
-        # Fetch campaigns day by day (not batched)
-        current_date = start_date
-        while current_date <= end_date:
-            # Make API call for each day individually (inefficient - should batch)
-            campaign_data = self._call_api(source, current_date)
-            
-            if campaign_data:
-                # Process each campaign
-                for data in campaign_data:
-                    campaign = Campaign(
-                        id=data['id'],
-                        name=data['name'],
-                        source=source.type,
-                        date=current_date,
-                        spend=data['spend'],
-                        impressions=data['impressions'],
-                        clicks=data['clicks'],
-                        conversions=data['conversions'],
-                        revenue=data.get('revenue'),
-                        currency=data.get('currency', 'USD')
-                    )
-                    campaigns.append(campaign)
-            
-            current_date += timedelta(days=1)
+        # One request covers the whole date range; each row carries its own date
+        campaign_data = self._call_api_cached(source, start_date, end_date)
+        
+        # Rows share a handful of dates and one sync timestamp, so parse each date
+        # once and skip Campaign.__post_init__'s clock reads. Arguments are
+        # positional in Campaign field order (keyword dispatch costs about as much
+        # as the construction itself).
+        synced_at = datetime.utcnow()
+        dates: Dict[str, datetime] = {}
+        for data in campaign_data:
+            day = data['date']
+            date = dates.get(day)
+            if date is None:
+                date = dates[day] = datetime.strptime(day, '%Y-%m-%d')
+            campaign = Campaign(
+                data['id'],
+                data['name'],
+                source.type,
+                date,
+                data['spend'],
+                data['impressions'],
+                data['clicks'],
+                data['conversions'],
+                data.get('revenue'),
+                data.get('currency', 'USD'),
+                synced_at,
+                synced_at
+            )
+            campaigns.append(campaign)
         
         return campaigns
     
-    def _call_api(self, source: DataSource, date: datetime) -> Optional[List[Dict]]:
+    def _call_api_cached(
+        self,
+        source: DataSource,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Dict]:
+        """
+        _call_api with the settled days of the range served from the in-memory cache.
+        
+        Only the days from the first settled day that isn't cached (or else from the
+        settlement window) through end_date are requested, in one call; the settled
+        days in the response are cached per day. A daily re-sync of recent days thus
+        requests just the last SETTLEMENT_DAYS.
         """
-        Call the API for a specific data source and date.
+        one_day = timedelta(days=1)
+        last_day = end_date.date()
+        first_unsettled = datetime.now().date() - timedelta(days=SETTLEMENT_DAYS - 1)
+        last_settled = min(last_day, first_unsettled - one_day)
+        account = (source.type, source.account_id)
+        now = time.monotonic()
+        
+        # Serve the cached prefix of settled days. Sources are fetched on a thread pool;
+        # the lock isn't held during the API call.
+        campaign_data: List[Dict] = []
+        fetch_from = start_date.date()
+        with self._api_cache_lock:
+            while fetch_from <= last_settled:
+                cached = self._api_cache.get((*account, fetch_from))
+                if cached is None or cached[0] <= now:
+                    break
+                campaign_data.extend(cached[1])
+                fetch_from += one_day
+        if fetch_from > last_day:
+            return campaign_data
+        
+        fetched = self._call_api(source, datetime.combine(fetch_from, datetime.min.time()), end_date)
+        
+        if fetch_from <= last_settled:
+            by_day: Dict[str, List[Dict]] = defaultdict(list)
+            for row in fetched:
+                by_day[row.get('date')].append(row)
+            expires = now + SETTLED_API_CACHE_TTL.total_seconds()
+            with self._api_cache_lock:
+                day = fetch_from
+                while day <= last_settled:
+                    key = (*account, day)
+                    # Re-inserted at the end, so an expired entry doesn't keep its old slot
+                    self._api_cache.pop(key, None)
+                    if len(self._api_cache) >= API_CACHE_SIZE:
+                        # Evict the oldest entry (dicts keep insertion order)
+                        del self._api_cache[next(iter(self._api_cache))]
+                    self._api_cache[key] = (expires, by_day.get(day.isoformat(), []))
+                    day += one_day
+        
+        campaign_data.extend(fetched)
+        return campaign_data
+    
+    def _request_template(self, source: DataSource) -> Tuple[str, Dict, Dict]:
+        """URL, headers and fixed query params for a source's API calls (built once per source)."""
+        # Keyed on everything the template is built from, so editing a source's
+        # credentials or account picks up a fresh template
+        key = (source.type, source.api_key, source.account_id)
+        template = self._request_templates.get(key)
+        if template is None:
+            # Construct API URL
+            api_url = f"https://api.{source.type}.com/v1/campaigns"
+            
+            headers = {
+                'Authorization': f'Bearer {source.api_key}',
+                'Content-Type': 'application/json'
+            }
+            
+            template = self._request_templates[key] = (
+                api_url, headers, {'account_id': source.account_id}
+            )
+        return template
+    
+    def _call_api(
+        self,
+        source: DataSource,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Dict]:
+        """
+        Call the API for a specific data source and date range.
         
         Args:
             source: DataSource to call
-            date: Date to fetch data for
+            start_date: First date to fetch data for
+            end_date: Last date to fetch data for (inclusive)
             
         Returns:
-            List of raw campaign data dictionaries
+            List of raw campaign data dictionaries, each with a 'date' (YYYY-MM-DD)
+            
+        Raises:
+            requests.HTTPError: If the API answers with an error status (after retries)
         """
-        # Construct API URL
-        api_url = f"https://api.{source.type}.com/v1/campaigns"
-        
-        headers = {
-            'Authorization': f'Bearer {source.api_key}',
-            'Content-Type': 'application/json'
-        }
-        
+        api_url, headers, base_params = self._request_template(source)
         params = {
-            'account_id': source.account_id,
-            'date': date.strftime('%Y-%m-%d')
+            **base_params,
+            'start_date': start_date.strftime('%Y-%m-%d'),
+            'end_date': end_date.strftime('%Y-%m-%d')
         }
         
-        # Make the API call - no retry logic, no timeout
-        response = requests.get(api_url, headers=headers, params=params)
-        
-        # No status code check
-        data = response.json()
-        
-        # Simulate some processing time
-        time.sleep(0.1)
+        # Pooled connection; transient failures are retried by the session's adapter
+        response = self._session.get(api_url, headers=headers, params=params, timeout=API_TIMEOUT)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
         
         return data.get('campaigns', [])
     
     def get_campaigns_by_source(self, source_type: str) -> List[Campaign]:
         """Get all campaigns for a specific source type."""
         # No validation of source_type
-        return [c for c in self.campaigns if c.source == source_type]
+        return list(self._by_source.get(source_type, ()))
     
     def get_total_spend(self, source_type: str = None) -> float:
         """Calculate total spend, optionally filtered by source."""
-        total = 0.0
-        
-        # Inefficient - recalculates every time
-        for campaign in self.campaigns:
-            if source_type is None or campaign.source == source_type:
-                total += campaign.spend
+        if source_type is not None:
+            return self._spend_by_source.get(source_type, 0.0)
         
-        return total
+        return self._total_spend
     
     def get_campaign_by_id(self, campaign_id: str) -> Optional[Campaign]:
         """Find a campaign by ID."""
-        # Linear search - no indexing
-        for campaign in self.campaigns:
-            if campaign.id == campaign_id:
-                return campaign
-        return None
+        return self._by_id.get(campaign_id)
     
     def aggregate_metrics(self, start_date: datetime, end_date: datetime) -> Dict:
         """
@@ -196,29 +373,44 @@ class MarketingDataService:
             
         Returns:
             Dictionary of aggregated metrics
+            
+        Results are cached per date range until the campaigns change through
+        sync_all_campaigns, update_campaign or assigning campaigns.
         """
+        key = (start_date, end_date, self._version)
+        cached = self._agg_cache.get(key)
+        if cached is None:
+            cached = self._compute_metrics(start_date, end_date)
+            if len(self._agg_cache) >= AGGREGATE_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._agg_cache[next(iter(self._agg_cache))]
+            self._agg_cache[key] = cached
+        return dict(cached)
+    
+    def _compute_metrics(self, start_date: datetime, end_date: datetime) -> Dict:
+        """Aggregate metrics over the campaigns dated within [start_date, end_date]."""
         # No validation of date parameters
         
-        total_spend = 0.0
-        total_impressions = 0
-        total_clicks = 0
-        total_conversions = 0
-        total_revenue = 0.0
+        # Column sums over the rows in range (NaN marks campaigns without revenue);
+        # converted back to Python numbers for the result. The columns are sorted
+        # by date, so the range is one contiguous slice found by binary search.
+        table = self._columns()
+        lo = np.searchsorted(table.date, np.datetime64(start_date), side='left')
+        hi = np.searchsorted(table.date, np.datetime64(end_date), side='right')
+        in_range = slice(lo, hi)
+        revenue = table.revenue[in_range]
+        total_spend = float(table.spend[in_range].sum())
+        # Counts are stored as int32; accumulate in int64 so totals can't overflow
+        total_impressions = int(table.impressions[in_range].sum(dtype=np.int64))
+        total_clicks = int(table.clicks[in_range].sum(dtype=np.int64))
+        total_conversions = int(table.conversions[in_range].sum(dtype=np.int64))
+        total_revenue = float(revenue[~np.isnan(revenue)].sum())
         
-        # Recalculate metrics by iterating through all campaigns
-        for campaign in self.campaigns:
-            if start_date <= campaign.date <= end_date:
-                total_spend += campaign.spend
-                total_impressions += campaign.impressions
-                total_clicks += campaign.clicks
-                total_conversions += campaign.conversions
-                if campaign.revenue:
-                    total_revenue += campaign.revenue
-        
-        # Calculate derived metrics without null checks
-        ctr = (total_clicks / total_impressions) * 100
-        conversion_rate = (total_conversions / total_clicks) * 100
-        roas = total_revenue / total_spend
+        # Derived metrics follow the Campaign properties when a denominator is zero
+        # (e.g. a range without campaigns): rates are 0.0 and ROAS is None
+        ctr = (total_clicks / total_impressions) * 100 if total_impressions else 0.0
+        conversion_rate = (total_conversions / total_clicks) * 100 if total_clicks else 0.0
+        roas = total_revenue / total_spend if total_spend else None
         
         return {
             'spend': total_spend,
@@ -241,8 +433,14 @@ class MarketingDataService:
             
         Returns:
             True if updated, False if not found
+            
+        Raises:
+            ValueError: If updates names a field Campaign doesn't have (nothing is updated)
         """
-        # No input validation
+        unknown = updates.keys() - _CAMPAIGN_FIELDS
+        if unknown:
+            raise ValueError(f"Unknown campaign field(s): {', '.join(sorted(unknown))}")
+        
         # No locking - race condition possible
         campaign = self.get_campaign_by_id(campaign_id)
         
@@ -250,19 +448,31 @@ class MarketingDataService:
             # Directly modify attributes from user input
             for key, value in updates.items():
                 setattr(campaign, key, value)
+            self._version += 1
+            self._table = None
+            if 'id' in updates or 'source' in updates:
+                self._reindex()
+            elif 'spend' in updates:
+                self._spend_by_source[campaign.source] = self._sum_spend(
+                    self._by_source[campaign.source]
+                )
+                # Re-add the per-source totals rather than applying a delta, so
+                # rounding errors can't accumulate over many updates
+                self._total_spend = sum(self._spend_by_source.values(), 0.0)
             return True
         
         return False
 
 
 # Mock API responses for testing
-def mock_api_response(source_type: str) -> Dict:
+def mock_api_response(source_type: str, date: str = '2024-10-15') -> Dict:
     """Generate mock API response for testing."""
     return {
         'campaigns': [
             {
                 'id': f'{source_type}_campaign_1',
                 'name': f'{source_type.title()} Campaign 1',
+                'date': date,
                 'spend': 1000.00,
                 'impressions': 50000,
                 'clicks': 1000,
@@ -273,6 +483,7 @@ def mock_api_response(source_type: str) -> Dict:
             {
                 'id': f'{source_type}_campaign_2',
                 'name': f'{source_type.title()} Campaign 2',
+                'date': date,
                 'spend': 2000.00,
                 'impressions': 100000,
                 'clicks': 2500,
@@ -0,0 +1,320 @@
+"""
+Unit tests for the marketing data service.
+
+Run with: pytest src/tests/test_marketingDataService.py -v
+"""
+
+import json
+import pytest
+from datetime import datetime
+from src.models.Campaign import Campaign
+from src.services import marketingDataService as module
+from src.services.marketingDataService import MarketingDataService, mock_api_response
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode()
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def api_calls(monkeypatch):
+    """Record every HTTP GET and answer it with the mock API response for its source."""
+    calls = []
+
+    def fake_get(session, url, headers=None, params=None, **kwargs):
+        calls.append({"url": url, "headers": headers, "params": params, **kwargs})
+        source_type = url.split("api.", 1)[1].split(".com", 1)[0]
+        return FakeResponse(mock_api_response(source_type))
+
+    monkeypatch.setattr(module.requests.Session, "get", fake_get)
+    return calls
+
+
+@pytest.fixture
+def service(api_calls):
+    """A service whose API calls are answered by mock_api_response."""
+    return MarketingDataService()
+
+
+def test_sync_fetches_active_sources_only(service):
+    """Test that inactive sources are skipped and every campaign is returned."""
+    campaigns = service.sync_all_campaigns(datetime(2024, 10, 1), datetime(2024, 10, 31))
+
+    assert {c.source for c in campaigns} == {"google_ads", "facebook_ads"}
+    assert len(campaigns) == 4
+    assert list(service.campaigns) == campaigns
+
+
+def test_sync_makes_one_request_per_source(service, api_calls):
+    """Test that a date range is fetched with a single request per source."""
+    service.sync_all_campaigns(datetime(2024, 10, 1), datetime(2024, 12, 31))
+
+    assert len(api_calls) == 2
+    for call in api_calls:
+        assert call["params"]["start_date"] == "2024-10-01"
+        assert call["params"]["end_date"] == "2024-12-31"
+
+
+def test_campaign_dates_come_from_the_response(service):
+    """Test that each campaign takes its date from its API row."""
+    campaigns = service.sync_all_campaigns(datetime(2024, 10, 1), datetime(2024, 10, 31))
+
+    assert all(c.date == datetime(2024, 10, 15) for c in campaigns)
+
+
+def test_api_calls_carry_source_credentials(service, api_calls):
+    """Test each request's URL, headers and account, including after a key change."""
+    service.sync_all_campaigns(datetime(2024, 10, 1), datetime(2024, 10, 31))
+    google = service.data_sources[0]
+    google.api_key = "rotated_key"
+    service.sync_all_campaigns(datetime(2024, 11, 1), datetime(2024, 11, 30))
+
+    # Sources are fetched concurrently, so pick the Google calls out by URL
+    first, rotated = [c for c in api_calls if c["url"] == "https://api.google_ads.com/v1/campaigns"]
+    assert first["headers"]["Authorization"] == "Bearer gads_secret_key_12345"
+    assert first["params"]["account_id"] == google.account_id
+    assert rotated["headers"]["Authorization"] == "Bearer rotated_key"
+
+
+def test_api_calls_use_a_timeout(service, api_calls):
+    """Test that every API request is sent with a timeout."""
+    service.sync_all_campaigns(datetime(2024, 10, 1), datetime(2024, 10, 31))
+
+    assert all(call["timeout"] == module.API_TIMEOUT for call in api_calls)
+
+
+def test_http_errors_skip_the_source(service, monkeypatch):
+    """Test that a source answering with an error status is skipped, not parsed."""
+    def failing_get(session, url, **kwargs):
+        response = module.requests.Response()
+        response.status_code = 503
+        response.url = url
+        return response
+
+    monkeypatch.setattr(module.requests.Session, "get", failing_get)
+
+    assert service.sync_all_campaigns(datetime(2024, 10, 1), datetime(2024, 10, 31)) == []
+
+
+def test_failing_source_does_not_stop_the_others(service, monkeypatch):
+    """Test that one source failing still returns the other sources' campaigns, in source order."""
+    fetch = MarketingDataService._fetch_campaigns_from_source
+
+    def flaky_fetch(self, source, start_date, end_date):
+        if source.type == "google_ads":
+            raise module.requests.ConnectionError("connection reset")
+        return fetch(self, source, start_date, end_date)
+
+    monkeypatch.setattr(MarketingDataService, "_fetch_campaigns_from_source", flaky_fetch)
+    campaigns = service.sync_all_campaigns(datetime(2024, 10, 1), datetime(2024, 10, 31))
+
+    assert [c.source for c in campaigns] == ["facebook_ads", "facebook_ads"]
+    google, facebook = service.data_sources[:2]
+    assert google.last_sync is None and facebook.last_sync is not None
+
+
+@pytest.fixture
+def synced_service(service):
+    """A service holding the mock campaigns of every active source."""
+    service.sync_all_campaigns(datetime(2024, 10, 1), datetime(2024, 10, 31))
+    return service
+
+
+def test_get_campaign_by_id(synced_service):
+    """Test lookups of existing and unknown campaign ids."""
+    campaign = synced_service.get_campaign_by_id("facebook_ads_campaign_2")
+
+    assert campaign is not None and campaign.spend == 2000.00
+    assert synced_service.get_campaign_by_id("missing") is None
+
+
+def test_update_campaign(synced_service):
+    """Test updating fields, renaming a campaign and rejecting unknown fields."""
+    assert synced_service.update_campaign("google_ads_campaign_1", {"spend": 1500.0}) is True
+    assert synced_service.get_campaign_by_id("google_ads_campaign_1").spend == 1500.0
+
+    assert synced_service.update_campaign("google_ads_campaign_1", {"id": "renamed"}) is True
+    assert synced_service.get_campaign_by_id("google_ads_campaign_1") is None
+    assert synced_service.get_campaign_by_id("renamed").spend == 1500.0
+
+    assert synced_service.update_campaign("missing", {"spend": 1.0}) is False
+    with pytest.raises(ValueError):
+        synced_service.update_campaign("renamed", {"budget": 1.0})
+
+
+def test_assigning_campaigns_rebuilds_the_index(synced_service):
+    """Test that replacing the campaign list keeps lookups consistent."""
+    keep = synced_service.get_campaign_by_id("google_ads_campaign_1")
+    synced_service.campaigns = [keep]
+
+    assert synced_service.get_campaign_by_id("google_ads_campaign_1") is keep
+    assert synced_service.get_campaign_by_id("facebook_ads_campaign_1") is None
+
+
+def test_campaigns_cannot_be_changed_behind_the_indexes(synced_service):
+    """Test that the stored campaigns are read-only and independent of the list they came from."""
+    extra = Campaign(id="extra", name="extra", source="google_ads", date=datetime(2024, 10, 15),
+                     spend=1.0, impressions=10, clicks=1, conversions=0)
+    with pytest.raises(AttributeError):
+        synced_service.campaigns.append(extra)
+
+    campaigns = [extra]
+    synced_service.campaigns = campaigns
+    campaigns.append(extra)
+    assert len(synced_service.campaigns) == 1
+    assert synced_service.get_total_spend() == 1.0
+
+
+def test_campaigns_and_spend_by_source(synced_service):
+    """Test the per-source lookups, including after updates that touch them."""
+    assert [c.id for c in synced_service.get_campaigns_by_source("google_ads")] == \
+        ["google_ads_campaign_1", "google_ads_campaign_2"]
+    assert synced_service.get_campaigns_by_source("shopify") == []
+    assert synced_service.get_total_spend("google_ads") == 3000.0
+    assert synced_service.get_total_spend() == 6000.0
+
+    synced_service.update_campaign("google_ads_campaign_1", {"spend": 1500.0})
+    assert synced_service.get_total_spend("google_ads") == 3500.0
+    assert synced_service.get_total_spend() == 6500.0
+
+    synced_service.update_campaign("google_ads_campaign_1", {"source": "facebook_ads"})
+    assert synced_service.get_total_spend("google_ads") == 2000.0
+    assert synced_service.get_total_spend("facebook_ads") == 4500.0
+    assert len(synced_service.get_campaigns_by_source("facebook_ads")) == 3
+    assert synced_service.get_total_spend() == 6500.0
+
+
+def test_aggregate_metrics(synced_service):
+    """Test the totals and derived metrics over a date range."""
+    metrics = synced_service.aggregate_metrics(datetime(2024, 10, 1), datetime(2024, 10, 31))
+
+    assert metrics["spend"] == 6000.0
+    assert metrics["impressions"] == 300000
+    assert metrics["clicks"] == 7000
+    assert metrics["conversions"] == 150
+    assert metrics["revenue"] == 15000.0
+    assert metrics["ctr"] == pytest.approx(7000 / 300000 * 100)
+    assert metrics["roas"] == pytest.approx(2.5)
+
+
+def test_aggregate_metrics_without_campaigns_in_range(synced_service):
+    """Test that an empty range gives zero totals instead of dividing by zero."""
+    metrics = synced_service.aggregate_metrics(datetime(2023, 1, 1), datetime(2023, 1, 31))
+
+    assert metrics["spend"] == 0.0 and metrics["impressions"] == 0
+    assert metrics["ctr"] == 0.0
+    assert metrics["conversion_rate"] == 0.0
+    assert metrics["roas"] is None
+
+
+def test_aggregate_metrics_cache_follows_updates(synced_service):
+    """Test that cached aggregates are reused but never served after an update."""
+    window = (datetime(2024, 10, 1), datetime(2024, 10, 31))
+    first = synced_service.aggregate_metrics(*window)
+    first["spend"] = -1  # callers get their own copy
+
+    assert synced_service.aggregate_metrics(*window)["spend"] == 6000.0
+
+    synced_service.update_campaign("google_ads_campaign_1", {"spend": 1500.0})
+    assert synced_service.aggregate_metrics(*window)["spend"] == 6500.0
+
+
+def test_aggregate_metrics_only_counts_campaigns_in_range(service):
+    """Test that the date range is inclusive and campaigns without revenue are handled."""
+    def campaign(day, revenue):
+        return Campaign(id=f"c{day}", name="c", source="google_ads", date=datetime(2024, 10, day),
+                        spend=100.0, impressions=1000, clicks=10, conversions=1, revenue=revenue)
+
+    service.campaigns = [campaign(3, 70.0), campaign(1, 50.0), campaign(4, 90.0), campaign(2, None)]
+    metrics = service.aggregate_metrics(datetime(2024, 10, 2), datetime(2024, 10, 3))
+
+    assert metrics["spend"] == 200.0
+    assert metrics["clicks"] == 20
+    assert metrics["revenue"] == 70.0
+    assert service.get_total_spend() == 400.0
+
+
+def test_aggregate_metrics_with_counts_beyond_int32(service):
+    """Test that counts too large for int32 columns are still summed exactly."""
+    service.campaigns = [
+        Campaign(id="big", name="big", source="google_ads", date=datetime(2024, 10, 1),
+                 spend=100.0, impressions=3_000_000_000, clicks=10, conversions=1),
+        Campaign(id="small", name="small", source="google_ads", date=datetime(2024, 10, 2),
+                 spend=100.0, impressions=1000, clicks=10, conversions=1),
+    ]
+    metrics = service.aggregate_metrics(datetime(2024, 10, 1), datetime(2024, 10, 31))
+
+    assert metrics["impressions"] == 3_000_001_000
+    assert metrics["clicks"] == 20
+
+
+@pytest.fixture
+def daily_api_calls(monkeypatch):
+    """Record every HTTP GET and answer it with one campaign row per day of the requested range."""
+    calls = []
+
+    def fake_get(session, url, headers=None, params=None, **kwargs):
+        calls.append(params)
+        day = datetime.strptime(params["start_date"], "%Y-%m-%d")
+        end = datetime.strptime(params["end_date"], "%Y-%m-%d")
+        rows = []
+        while day <= end:
+            row = mock_api_response("google_ads", day.strftime("%Y-%m-%d"))["campaigns"][0]
+            rows.append({**row, "id": f"campaign_{row['date']}"})
+            day += module.timedelta(days=1)
+        return FakeResponse({"campaigns": rows})
+
+    monkeypatch.setattr(module.requests.Session, "get", fake_get)
+    return calls
+
+
+def test_resync_fetches_only_unsettled_days(daily_api_calls, monkeypatch):
+    """Test that repeating a sync ending today only requests the last SETTLEMENT_DAYS again."""
+    clock = [1000.0]
+    monkeypatch.setattr(module.time, "monotonic", lambda: clock[0])
+    service = MarketingDataService()
+    service.data_sources = service.data_sources[:1]
+    end = datetime.now()
+    start = end - module.timedelta(days=7)
+    first_unsettled = (end - module.timedelta(days=module.SETTLEMENT_DAYS - 1)).strftime("%Y-%m-%d")
+
+    first = service.sync_all_campaigns(start, end)
+    assert daily_api_calls[-1]["start_date"] == start.strftime("%Y-%m-%d")
+
+    second = service.sync_all_campaigns(start, end)
+    assert len(daily_api_calls) == 2
+    assert daily_api_calls[-1]["start_date"] == first_unsettled
+    assert daily_api_calls[-1]["end_date"] == end.strftime("%Y-%m-%d")
+    assert [c.id for c in second] == [c.id for c in first]
+    assert len(second) == 8  # settled days from the cache, the last days fetched again
+
+    clock[0] += module.SETTLED_API_CACHE_TTL.total_seconds() + 1
+    service.sync_all_campaigns(start, end)
+    assert daily_api_calls[-1]["start_date"] == start.strftime("%Y-%m-%d")  # settled days expired
+
+
+def test_settled_ranges_are_served_from_the_cache(service, api_calls):
+    """Test that repeating a sync of a fully settled range makes no requests."""
+    service.sync_all_campaigns(datetime(2024, 10, 1), datetime(2024, 10, 31))
+    campaigns = service.sync_all_campaigns(datetime(2024, 10, 1), datetime(2024, 10, 31))
+
+    assert len(api_calls) == 2
+    assert len(campaigns) == 4
+
+
+def test_concurrent_cache_eviction(service, api_calls, monkeypatch):
+    """Test that sources filling a full cache at the same time are all synced."""
+    monkeypatch.setattr(module, "API_CACHE_SIZE", 1)
+    for source in service.data_sources:
+        source.is_active = True
+
+    for month in range(1, 7):
+        campaigns = service.sync_all_campaigns(datetime(2024, month, 1), datetime(2024, month, 28))
+        assert {c.source for c in campaigns} == {"google_ads", "facebook_ads", "tiktok_ads"}
+    assert len(service._api_cache) == 1
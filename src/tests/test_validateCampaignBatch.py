@@ -0,0 +1,196 @@
+"""
+Unit tests for batch campaign data validation.
+
+Run with: pytest src/tests/test_validateCampaignBatch.py -v
+"""
+
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+from src.functions.validateCampaignData import validate_campaign_data
+from src.functions.validateCampaignBatch import (
+    ERROR_FLAGS,
+    FIELD_ERROR_FLAG,
+    campaign_batch_validity,
+    validate_campaign_batch,
+    validate_campaign_columns,
+)
+
+
+@pytest.fixture
+def valid_base_campaign():
+    """A minimal valid campaign to use as a base for batch testing."""
+    return {
+        "campaign_id": "camp_test",
+        "source": "google_ads",
+        "date": "2024-10-15",
+        "spend": 1000.0,
+        "impressions": 10000,
+        "clicks": 500
+    }
+
+
+@pytest.fixture
+def mixed_batch(valid_base_campaign):
+    """A batch mixing valid, invalid and anomalous campaigns."""
+    recent = (datetime.now() - timedelta(days=10)).strftime("%Y-%m-%d")
+    future = (datetime.now() + timedelta(days=5)).strftime("%Y-%m-%d")
+    overrides = [
+        {"date": recent},
+        {},
+        {"spend": -1},
+        {"spend": "1000.00"},
+        {"revenue": None},
+        {"clicks": 20000},
+        {"impressions": 0},
+        {"impressions": 100, "clicks": 51},
+        {"impressions": 100, "clicks": 50},
+        {"clicks": 100, "conversions": 101},
+        {"conversions": 10},
+        {"conversions": 10, "revenue": 0},
+        {"conversions": 10, "revenue": 100.0},
+        {"spend": 150000.0},
+        {"clicks": 0},
+        {"date": future},
+        {"date": "2024-13-01"},
+        {"source": "unknown_ads"},
+    ]
+    batch = [{**valid_base_campaign, **o, "campaign_id": f"camp_{i}"} for i, o in enumerate(overrides)]
+    missing = dict(valid_base_campaign, campaign_id="camp_missing")
+    del missing["clicks"]
+    return batch + [missing]
+
+
+def _without_timestamp(result):
+    return {k: v for k, v in result.items() if k != "validated_at"}
+
+
+def test_batch_matches_single_record_validation(mixed_batch):
+    """Test that every batch result equals validating the record on its own."""
+    results = validate_campaign_batch(mixed_batch)
+
+    assert len(results) == len(mixed_batch)
+    for campaign, result in zip(mixed_batch, results):
+        expected = validate_campaign_data(campaign)
+        assert _without_timestamp(result) == _without_timestamp(expected), campaign["campaign_id"]
+
+
+def test_batch_preserves_order_and_ids(mixed_batch):
+    """Test that results come back in input order."""
+    results = validate_campaign_batch(mixed_batch)
+
+    assert [r["campaign_id"] for r in results] == [c["campaign_id"] for c in mixed_batch]
+
+
+def test_batch_validity_matches_results(mixed_batch):
+    """Test that the message-free validity mask agrees with the full results."""
+    valid = campaign_batch_validity(mixed_batch)
+
+    assert valid.tolist() == [r["valid"] for r in validate_campaign_batch(mixed_batch)]
+
+
+def test_empty_batch():
+    """Test that an empty batch returns no results."""
+    assert validate_campaign_batch([]) == []
+    assert len(campaign_batch_validity([])) == 0
+
+
+def test_batch_of_all_invalid_records():
+    """Test that a batch where no record type-checks still reports every error."""
+    results = validate_campaign_batch([{"campaign_id": "a"}, {"campaign_id": "b"}])
+
+    assert all(r["valid"] is False for r in results)
+    assert all(any("missing required field" in e.lower() for e in r["errors"]) for r in results)
+
+
+def test_columns_match_batch_validity(mixed_batch):
+    """Test that object columns built from the batch give the same validity as the records."""
+    # A null cell means 'absent' in column input, so skip records with an explicit None
+    records = [c for c in mixed_batch if None not in c.values()]
+    fields = ["campaign_id", "source", "date", "spend", "impressions", "clicks",
+              "conversions", "revenue"]
+    columns = {f: np.array([c.get(f) for c in records], dtype=object) for f in fields}
+
+    flags = validate_campaign_columns(columns)
+
+    assert ((flags & ERROR_FLAGS) == 0).tolist() == campaign_batch_validity(records).tolist()
+
+
+def test_typed_columns():
+    """Test typed NumPy columns, including a nullable int column arriving as float with NaN."""
+    today = np.datetime64(datetime.now().date(), "D")
+    columns = {
+        "campaign_id": np.array(["a", "b", "c", "d", "e"]),
+        "source": np.array(["google_ads"] * 5),
+        "date": np.array([today - 10, today - 10, today + 5, today - 120, today - 10]),
+        "spend": np.array([100.0, -1.0, 100.0, 150000.0, 100.0]),
+        "impressions": np.array([1000, 1000, 1000, 1000, 1000]),
+        "clicks": np.array([10, 10, 10, 0, 10]),
+        "conversions": np.array([1.0, np.nan, 2.0, np.nan, np.inf]),
+    }
+
+    flags = validate_campaign_columns(columns)
+    valid = (flags & ERROR_FLAGS) == 0
+
+    assert valid.tolist() == [True, False, False, True, False]
+    assert flags[4] == FIELD_ERROR_FLAG  # inf is not an int
+    assert flags[0] != 0  # conversions without revenue
+    assert flags[3] != 0  # old date, no clicks, high spend
+    assert flags[1] & FIELD_ERROR_FLAG and flags[2] & FIELD_ERROR_FLAG
+
+
+def test_batch_reference_time(valid_base_campaign, mixed_batch):
+    """Test that the batch and column entry points honour the same reference time as single records."""
+    now = datetime(2024, 10, 20)
+    results = validate_campaign_batch(mixed_batch, now=now)
+
+    for campaign, result in zip(mixed_batch, results):
+        expected = validate_campaign_data(campaign, now=now)
+        assert _without_timestamp(result) == _without_timestamp(expected), campaign["campaign_id"]
+    assert campaign_batch_validity(mixed_batch, now=now).tolist() == [r["valid"] for r in results]
+
+    columns = {k: np.array([v]) for k, v in valid_base_campaign.items()}
+    assert validate_campaign_columns(columns, now=now)[0] == 0
+    assert validate_campaign_columns(columns, now=datetime(2024, 10, 1))[0] & FIELD_ERROR_FLAG
+
+
+def test_single_record_batch(mixed_batch):
+    """Test that one-record batches (scalar path) match single record validation."""
+    for campaign in mixed_batch:
+        [result] = validate_campaign_batch([campaign])
+        assert _without_timestamp(result) == _without_timestamp(validate_campaign_data(campaign))
+
+
+def test_huge_counts_match_single_record(valid_base_campaign):
+    """Test that counts whose CTR products overflow int64 are judged like single records."""
+    batch = [
+        {**valid_base_campaign, "impressions": 10**18, "clicks": 6 * 10**16},
+        {**valid_base_campaign, "impressions": 10**18, "clicks": 6 * 10**17},
+        valid_base_campaign,
+    ]
+    results = validate_campaign_batch(batch)
+
+    assert [r["valid"] for r in results] == [True, False, True]
+    for campaign, result in zip(batch, results):
+        assert _without_timestamp(result) == _without_timestamp(validate_campaign_data(campaign))
+    assert campaign_batch_validity(batch).tolist() == [True, False, True]
+
+
+def test_counts_beyond_int64(valid_base_campaign):
+    """Test that ints too large for int64 columns are validated like single records."""
+    batch = [
+        {**valid_base_campaign, "impressions": 10**19},
+        {**valid_base_campaign, "impressions": 10**19, "clicks": 10**19 + 1},
+        valid_base_campaign,
+    ]
+    results = validate_campaign_batch(batch)
+
+    for campaign, result in zip(batch, results):
+        assert _without_timestamp(result) == _without_timestamp(validate_campaign_data(campaign))
+    assert campaign_batch_validity(batch).tolist() == [True, False, True]
+
+    columns = {k: np.array([c[k] for c in batch], dtype=object) for k in valid_base_campaign}
+    assert ((validate_campaign_columns(columns) & ERROR_FLAGS) == 0).tolist() == [True, False, True]
+    columns["impressions"] = np.array([10**19, 10**19, 10000], dtype=np.uint64)
+    columns["clicks"] = np.array([500, 10**19 + 1, 500], dtype=np.uint64)
+    assert ((validate_campaign_columns(columns) & ERROR_FLAGS) == 0).tolist() == [True, False, True]
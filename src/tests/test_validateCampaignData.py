@@ -4,17 +4,62 @@ Unit tests for campaign data validation.
 Run with: pytest src/tests/test_validateCampaignData.py -v
 """
 
+import re
 import pytest
 from datetime import datetime, timedelta
-from src.functions.validateCampaignData import validate_campaign_data
+from types import MappingProxyType
+from src.functions.validateCampaignData import (
+    CampaignData,
+    ValidationResult,
+    campaign_is_valid,
+    validate_campaign_data,
+    validate_campaign_result,
+    validate_into,
+)
+
+
+# Message matchers - case-insensitive, the words may appear in either order
+
+def _mentions(*words: str) -> re.Pattern:
+    """Pattern matching messages that contain every one of the given words (or alternations)."""
+    return re.compile("".join(f"(?=.*(?:{w}))" for w in words), re.IGNORECASE)
+
+
+_IMPRESSIONS_AND_CLICKS = _mentions("impressions", "clicks")
+_IMPRESSIONS_CLICKS_OR_IMPOSSIBLE = re.compile(
+    f"{_IMPRESSIONS_AND_CLICKS.pattern}|impossible", re.IGNORECASE
+)
+_CTR_OR_IMPRESSIONS_CLICKS = re.compile(f"{_IMPRESSIONS_AND_CLICKS.pattern}|ctr", re.IGNORECASE)
+_HIGH_SPEND = _mentions("spend", "high|unusual")
+_CONVERSIONS_AND_REVENUE = _mentions("conversions", "revenue")
+_CONVERSIONS_AND_CLICKS = _mentions("conversions", "clicks")
+_NEGATIVE_SPEND = _mentions("spend", "negative")
+_NEGATIVE_REVENUE = _mentions("revenue", "negative")
+_FUTURE_DATE = _mentions("date", "future")
+_OLD_DATE = _mentions("date", "days")
+
+
+# Relative dates are computed from one "now" taken at import, and the date tests
+# pass it to the validator as well, so both agree on today even across midnight
+_NOW = datetime.now()
+
+
+def _days_from_now(days: int) -> str:
+    """The date `days` after (or before, if negative) _NOW, as YYYY-MM-DD."""
+    return (_NOW + timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def _ids(cases) -> list:
+    """Test ids for parametrize cases whose last element is a description."""
+    return [case[-1] for case in cases]
 
 
 # Test Fixtures - Various campaign data scenarios
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_campaign():
     """A valid campaign with all required fields and reasonable metrics."""
-    return {
+    return MappingProxyType({
         "campaign_id": "camp_valid_001",
         "campaign_name": "Summer Sale 2024",
         "source": "google_ads",
@@ -25,36 +70,41 @@ def valid_campaign():
         "conversions": 50,
         "revenue": 7500.00,
         "currency": "USD"
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def campaign_missing_required_fields():
     """Campaign missing required fields."""
-    return {
+    return MappingProxyType({
         "campaign_id": "camp_missing_001",
         "source": "facebook_ads",
         # Missing: date, spend, impressions, clicks
-    }
+    })
+
 
+# Read-only, so one instance can be shared by every test; build variants with
+# {**valid_base_campaign, field: value}
+_BASE_CAMPAIGN = MappingProxyType({
+    "campaign_id": "camp_test",
+    "source": "google_ads",
+    "date": "2024-10-15",
+    "spend": 1000.0,
+    "impressions": 10000,
+    "clicks": 500
+})
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def valid_base_campaign():
     """A minimal valid campaign to use as a base for type testing."""
-    return {
-        "campaign_id": "camp_test",
-        "source": "google_ads",
-        "date": "2024-10-15",
-        "spend": 1000.0,
-        "impressions": 10000,
-        "clicks": 500
-    }
+    return _BASE_CAMPAIGN
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def campaign_impossible_metrics():
     """Campaign with impossible metric combinations."""
-    return {
+    return MappingProxyType({
         "campaign_id": "camp_impossible_001",
         "source": "google_ads",
         "date": "2024-10-15",
@@ -62,13 +112,13 @@ def campaign_impossible_metrics():
         "impressions": 0,  # 0 impressions
         "clicks": 500,  # but 500 clicks - impossible!
         "conversions": 10
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def campaign_clicks_exceed_impressions():
     """Campaign where clicks exceed impressions."""
-    return {
+    return MappingProxyType({
         "campaign_id": "camp_exceed_001",
         "source": "facebook_ads",
         "date": "2024-10-15",
@@ -76,13 +126,13 @@ def campaign_clicks_exceed_impressions():
         "impressions": 1000,
         "clicks": 1500,  # More clicks than impressions
         "conversions": 20
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def campaign_conversions_exceed_clicks():
     """Campaign where conversions exceed clicks."""
-    return {
+    return MappingProxyType({
         "campaign_id": "camp_conv_001",
         "source": "google_ads",
         "date": "2024-10-15",
@@ -90,14 +140,14 @@ def campaign_conversions_exceed_clicks():
         "impressions": 50000,
         "clicks": 100,
         "conversions": 150  # More conversions than clicks
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def campaign_future_date():
     """Campaign with a date in the future."""
-    future_date = (datetime.now() + timedelta(days=5)).strftime("%Y-%m-%d")
-    return {
+    future_date = _days_from_now(5)
+    return MappingProxyType({
         "campaign_id": "camp_future_001",
         "source": "google_ads",
         "date": future_date,
@@ -105,14 +155,14 @@ def campaign_future_date():
         "impressions": 10000,
         "clicks": 200,
         "conversions": 5
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def campaign_very_old_date():
     """Campaign with a date more than 90 days old (should trigger warning)."""
-    old_date = (datetime.now() - timedelta(days=120)).strftime("%Y-%m-%d")
-    return {
+    old_date = _days_from_now(-120)
+    return MappingProxyType({
         "campaign_id": "camp_old_001",
         "source": "facebook_ads",
         "date": old_date,
@@ -120,13 +170,13 @@ def campaign_very_old_date():
         "impressions": 5000,
         "clicks": 100,
         "conversions": 2
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def campaign_high_spend():
     """Campaign with unusually high spend (should trigger warning)."""
-    return {
+    return MappingProxyType({
         "campaign_id": "camp_highspend_001",
         "source": "google_ads",
         "date": "2024-10-15",
@@ -135,13 +185,13 @@ def campaign_high_spend():
         "clicks": 10000,
         "conversions": 200,
         "revenue": 300000.00
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def campaign_high_ctr():
     """Campaign with impossibly high CTR (>50%)."""
-    return {
+    return MappingProxyType({
         "campaign_id": "camp_highctr_001",
         "source": "tiktok_ads",
         "date": "2024-10-15",
@@ -149,13 +199,13 @@ def campaign_high_ctr():
         "impressions": 1000,
         "clicks": 600,  # 60% CTR - likely data quality issue
         "conversions": 30
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def campaign_conversions_no_revenue():
     """Campaign with conversions but no revenue (should trigger warning)."""
-    return {
+    return MappingProxyType({
         "campaign_id": "camp_norev_001",
         "source": "facebook_ads",
         "date": "2024-10-15",
@@ -164,13 +214,13 @@ def campaign_conversions_no_revenue():
         "clicks": 1000,
         "conversions": 25
         # No revenue field
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def campaign_impressions_no_clicks():
     """Campaign with impressions but zero clicks (unusual but possible)."""
-    return {
+    return MappingProxyType({
         "campaign_id": "camp_noclicks_001",
         "source": "google_ads",
         "date": "2024-10-15",
@@ -178,13 +228,13 @@ def campaign_impressions_no_clicks():
         "impressions": 10000,
         "clicks": 0,  # 0 clicks - unusual but possible
         "conversions": 0
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def campaign_negative_values():
     """Campaign with negative values."""
-    return {
+    return MappingProxyType({
         "campaign_id": "camp_negative_001",
         "source": "facebook_ads",
         "date": "2024-10-15",
@@ -192,7 +242,7 @@ def campaign_negative_values():
         "impressions": 10000,
         "clicks": 200,
         "conversions": 5
-    }
+    })
 
 
 # Test Cases
@@ -202,7 +252,7 @@ def test_valid_campaign_passes_validation(valid_campaign):
     result = validate_campaign_data(valid_campaign)
     
     assert result["valid"] is True
-    assert len(result["errors"]) == 0
+    assert not result["errors"]
     assert result["campaign_id"] == "camp_valid_001"
     assert "validated_at" in result
 
@@ -212,7 +262,7 @@ def test_missing_required_fields_fails(campaign_missing_required_fields):
     result = validate_campaign_data(campaign_missing_required_fields)
     
     assert result["valid"] is False
-    assert len(result["errors"]) > 0
+    assert result["errors"]
     # Should have errors for missing date, spend, impressions, clicks
 
 
@@ -221,7 +271,7 @@ def test_impossible_metrics_fails(campaign_impossible_metrics):
     result = validate_campaign_data(campaign_impossible_metrics)
     
     assert result["valid"] is False
-    assert len(result["errors"]) > 0
+    assert result["errors"]
     # Should detect that clicks > 0 when impressions = 0
 
 
@@ -230,7 +280,7 @@ def test_clicks_exceed_impressions_fails(campaign_clicks_exceed_impressions):
     result = validate_campaign_data(campaign_clicks_exceed_impressions)
     
     assert result["valid"] is False
-    assert len(result["errors"]) > 0
+    assert result["errors"]
 
 
 def test_conversions_exceed_clicks_fails(campaign_conversions_exceed_clicks):
@@ -238,23 +288,23 @@ def test_conversions_exceed_clicks_fails(campaign_conversions_exceed_clicks):
     result = validate_campaign_data(campaign_conversions_exceed_clicks)
     
     assert result["valid"] is False
-    assert len(result["errors"]) > 0
+    assert result["errors"]
 
 
 def test_future_date_fails(campaign_future_date):
     """Test that future dates fail validation."""
-    result = validate_campaign_data(campaign_future_date)
+    result = validate_campaign_data(campaign_future_date, now=_NOW)
     
     assert result["valid"] is False
-    assert len(result["errors"]) > 0
+    assert result["errors"]
 
 
 def test_old_date_triggers_warning(campaign_very_old_date):
     """Test that very old dates trigger a warning but don't fail validation."""
-    result = validate_campaign_data(campaign_very_old_date)
+    result = validate_campaign_data(campaign_very_old_date, now=_NOW)
     
     # Should still be valid but with warnings
-    assert len(result["warnings"]) > 0
+    assert result["warnings"]
 
 
 def test_high_spend_triggers_warning(campaign_high_spend):
@@ -262,7 +312,7 @@ def test_high_spend_triggers_warning(campaign_high_spend):
     result = validate_campaign_data(campaign_high_spend)
     
     # Should pass validation but include warning
-    assert len(result["warnings"]) > 0
+    assert result["warnings"]
 
 
 def test_high_ctr_fails(campaign_high_ctr):
@@ -270,7 +320,7 @@ def test_high_ctr_fails(campaign_high_ctr):
     result = validate_campaign_data(campaign_high_ctr)
     
     assert result["valid"] is False
-    assert len(result["errors"]) > 0
+    assert result["errors"]
 
 
 def test_conversions_no_revenue_warning(campaign_conversions_no_revenue):
@@ -278,12 +328,12 @@ def test_conversions_no_revenue_warning(campaign_conversions_no_revenue):
     result = validate_campaign_data(campaign_conversions_no_revenue)
     
     # Should be valid but have a warning
-    assert len(result["warnings"]) > 0
+    assert result["warnings"]
 
 
 # Anomaly Detection Tests - Simple and Reusable Pattern
 
-@pytest.mark.parametrize("impressions,clicks,should_fail,should_warn,description", [
+_IMPRESSIONS_CLICKS_ANOMALIES_CASES = (
     # impressions > 0 but clicks == 0 (warning - unusual but possible)
     (1000, 0, False, True, "impressions with zero clicks - unusual"),
     (10000, 0, False, True, "high impressions with zero clicks"),
@@ -297,34 +347,32 @@ def test_conversions_no_revenue_warning(campaign_conversions_no_revenue):
     (1000, 500, False, False, "normal CTR"),
     (1000, 10, False, False, "low CTR"),
     (0, 0, False, False, "zero impressions and zero clicks"),
-])
+)
+
+
+@pytest.mark.parametrize("impressions,clicks,should_fail,should_warn,description", _IMPRESSIONS_CLICKS_ANOMALIES_CASES,
+                         ids=_ids(_IMPRESSIONS_CLICKS_ANOMALIES_CASES))
 def test_impressions_clicks_anomalies(valid_base_campaign, impressions, clicks, should_fail, should_warn, description):
     """Test anomaly detection for impressions/clicks combinations."""
-    campaign = valid_base_campaign.copy()
-    campaign["impressions"] = impressions
-    campaign["clicks"] = clicks
+    campaign = {**valid_base_campaign, "impressions": impressions, "clicks": clicks}
 
     result = validate_campaign_data(campaign)
 
     if should_fail:
         assert result["valid"] is False, f"Should fail for {description}"
-        assert any(("impressions" in error.lower() and "clicks" in error.lower()) or
-                   "impossible" in error.lower()
-                   for error in result["errors"])
+        assert any(map(_IMPRESSIONS_CLICKS_OR_IMPOSSIBLE.search, result["errors"]))
     else:
         # Check for impossible impressions/clicks errors specifically
-        impossible_errors = [e for e in result["errors"]
-                            if "impossible" in e.lower() or
-                            (("impressions" in e.lower() and "0" in e) and "clicks" in e.lower())]
-        assert len(impossible_errors) == 0, f"Should not fail for {description}"
+        impossible_errors = [e for e in map(str.lower, result["errors"])
+                             if "impossible" in e or ("impressions" in e and "0" in e and "clicks" in e)]
+        assert not impossible_errors, f"Should not fail for {description}"
 
     if should_warn:
-        assert len(result["warnings"]) > 0, f"Should warn for {description}"
-        assert any("impressions" in warning.lower() and "clicks" in warning.lower()
-                   for warning in result["warnings"])
+        assert result["warnings"], f"Should warn for {description}"
+        assert any(map(_IMPRESSIONS_AND_CLICKS.search, result["warnings"]))
 
 
-@pytest.mark.parametrize("spend_value,should_warn,description", [
+_HIGH_SPEND_ANOMALY_CASES = (
     (100000, False, "exactly $100,000 - not unusual"),
     (100000.01, True, "just over $100,000"),
     (100001, True, "$100,001"),
@@ -333,26 +381,27 @@ def test_impressions_clicks_anomalies(valid_base_campaign, impressions, clicks,
     (99999.99, False, "just under $100,000"),
     (50000, False, "$50,000"),
     (1000, False, "normal spend"),
-])
+)
+
+
+@pytest.mark.parametrize("spend_value,should_warn,description", _HIGH_SPEND_ANOMALY_CASES,
+                         ids=_ids(_HIGH_SPEND_ANOMALY_CASES))
 def test_high_spend_anomaly(valid_base_campaign, spend_value, should_warn, description):
     """Test spend > $100,000 warning (unusual)."""
-    campaign = valid_base_campaign.copy()
-    campaign["spend"] = spend_value
+    campaign = {**valid_base_campaign, "spend": spend_value}
 
     result = validate_campaign_data(campaign)
 
     if should_warn:
-        assert len(result["warnings"]) > 0, f"Should warn for {description}"
-        assert any("spend" in warning.lower() and ("high" in warning.lower() or "unusual" in warning.lower())
-                   for warning in result["warnings"])
+        assert result["warnings"], f"Should warn for {description}"
+        assert any(map(_HIGH_SPEND.search, result["warnings"]))
     else:
         # Should not have high spend warnings
-        high_spend_warnings = [w for w in result["warnings"]
-                              if "spend" in w.lower() and ("high" in w.lower() or "unusual" in w.lower())]
-        assert len(high_spend_warnings) == 0, f"Should not warn for {description}"
+        high_spend_warnings = [w for w in result["warnings"] if _HIGH_SPEND.search(w)]
+        assert not high_spend_warnings, f"Should not warn for {description}"
 
 
-@pytest.mark.parametrize("impressions,clicks,should_fail,description", [
+_HIGH_CTR_ANOMALY_CASES = (
     # CTR > 50% (error - likely data quality issue)
     (100, 51, True, "51% CTR - just over threshold"),
     (100, 60, True, "60% CTR"),
@@ -365,27 +414,27 @@ def test_high_spend_anomaly(valid_base_campaign, spend_value, should_warn, descr
     (100, 25, False, "25% CTR"),
     (1000, 50, False, "5% CTR - normal"),
     (1000, 1, False, "0.1% CTR - low but valid"),
-])
+)
+
+
+@pytest.mark.parametrize("impressions,clicks,should_fail,description", _HIGH_CTR_ANOMALY_CASES,
+                         ids=_ids(_HIGH_CTR_ANOMALY_CASES))
 def test_high_ctr_anomaly(valid_base_campaign, impressions, clicks, should_fail, description):
     """Test CTR > 50% error (likely data quality issue)."""
-    campaign = valid_base_campaign.copy()
-    campaign["impressions"] = impressions
-    campaign["clicks"] = clicks
+    campaign = {**valid_base_campaign, "impressions": impressions, "clicks": clicks}
 
     result = validate_campaign_data(campaign)
 
     if should_fail:
         assert result["valid"] is False, f"Should fail for {description}"
-        assert any("ctr" in error.lower() or ("clicks" in error.lower() and "impressions" in error.lower())
-                   for error in result["errors"])
+        assert any(map(_CTR_OR_IMPRESSIONS_CLICKS.search, result["errors"]))
     else:
         # Should not have high CTR errors
-        ctr_errors = [e for e in result["errors"]
-                     if "ctr" in e.lower() or ("high" in e.lower() and "%" in e)]
-        assert len(ctr_errors) == 0, f"Should not fail for {description}"
+        ctr_errors = [e for e in map(str.lower, result["errors"]) if "ctr" in e or ("high" in e and "%" in e)]
+        assert not ctr_errors, f"Should not fail for {description}"
 
 
-@pytest.mark.parametrize("conversions,revenue,should_warn,description", [
+_CONVERSIONS_REVENUE_ANOMALY_CASES = (
     # conversions > 0 but revenue == 0 or missing (warning)
     (10, 0, True, "conversions with zero revenue"),
     (1, 0, True, "1 conversion with zero revenue"),
@@ -397,34 +446,34 @@ def test_high_ctr_anomaly(valid_base_campaign, impressions, clicks, should_fail,
     (1, 0.01, False, "conversions with small revenue"),
     (0, 0, False, "no conversions, no revenue"),
     (0, None, False, "no conversions, missing revenue"),
-])
+)
+
+
+@pytest.mark.parametrize("conversions,revenue,should_warn,description", _CONVERSIONS_REVENUE_ANOMALY_CASES,
+                         ids=_ids(_CONVERSIONS_REVENUE_ANOMALY_CASES))
 def test_conversions_revenue_anomaly(valid_base_campaign, conversions, revenue, should_warn, description):
     """Test conversions > 0 but revenue == 0 or missing warning."""
-    campaign = valid_base_campaign.copy()
-    campaign["conversions"] = conversions
-
     if revenue is None:
         # Don't include revenue field at all
-        campaign.pop("revenue", None)
+        campaign = {k: v for k, v in valid_base_campaign.items() if k != "revenue"}
+        campaign["conversions"] = conversions
     else:
-        campaign["revenue"] = revenue
+        campaign = {**valid_base_campaign, "conversions": conversions, "revenue": revenue}
 
     result = validate_campaign_data(campaign)
 
     if should_warn:
-        assert len(result["warnings"]) > 0, f"Should warn for {description}"
-        assert any("conversions" in warning.lower() and "revenue" in warning.lower()
-                   for warning in result["warnings"])
+        assert result["warnings"], f"Should warn for {description}"
+        assert any(map(_CONVERSIONS_AND_REVENUE.search, result["warnings"]))
     else:
         # Should not have conversions/revenue warnings
-        conv_revenue_warnings = [w for w in result["warnings"]
-                                if "conversions" in w.lower() and "revenue" in w.lower()]
-        assert len(conv_revenue_warnings) == 0, f"Should not warn for {description}"
+        conv_revenue_warnings = [w for w in result["warnings"] if _CONVERSIONS_AND_REVENUE.search(w)]
+        assert not conv_revenue_warnings, f"Should not warn for {description}"
 
 
 # Business Rules Validation Tests - Simple and Reusable Pattern
 
-@pytest.mark.parametrize("spend_value,should_fail,description", [
+_SPEND_VALIDATION_CASES = (
     (-1, True, "negative spend"),
     (-0.01, True, "small negative spend"),
     (-1000, True, "large negative spend"),
@@ -432,50 +481,54 @@ def test_conversions_revenue_anomaly(valid_base_campaign, conversions, revenue,
     (0.01, False, "small positive spend"),
     (1000, False, "normal spend"),
     (100000, False, "large spend"),
-])
+)
+
+
+@pytest.mark.parametrize("spend_value,should_fail,description", _SPEND_VALIDATION_CASES,
+                         ids=_ids(_SPEND_VALIDATION_CASES))
 def test_spend_validation(valid_base_campaign, spend_value, should_fail, description):
     """Test spend >= 0 rule."""
-    campaign = valid_base_campaign.copy()
-    campaign["spend"] = spend_value
+    campaign = {**valid_base_campaign, "spend": spend_value}
 
     result = validate_campaign_data(campaign)
 
     if should_fail:
         assert result["valid"] is False, f"Should fail for {description}"
-        assert any("spend" in error.lower() and "negative" in error.lower()
-                   for error in result["errors"])
+        assert any(map(_NEGATIVE_SPEND.search, result["errors"]))
     else:
         # Should not have spend-related errors
-        spend_errors = [e for e in result["errors"] if "spend" in e.lower() and "negative" in e.lower()]
-        assert len(spend_errors) == 0, f"Should accept {description}"
+        spend_errors = [e for e in result["errors"] if _NEGATIVE_SPEND.search(e)]
+        assert not spend_errors, f"Should accept {description}"
 
 
-@pytest.mark.parametrize("revenue_value,should_fail,description", [
+_REVENUE_VALIDATION_CASES = (
     (-1, True, "negative revenue"),
     (-0.01, True, "small negative revenue"),
     (-1000, True, "large negative revenue"),
     (0, False, "zero revenue"),
     (0.01, False, "small positive revenue"),
     (1000, False, "normal revenue"),
-])
+)
+
+
+@pytest.mark.parametrize("revenue_value,should_fail,description", _REVENUE_VALIDATION_CASES,
+                         ids=_ids(_REVENUE_VALIDATION_CASES))
 def test_revenue_validation(valid_base_campaign, revenue_value, should_fail, description):
     """Test revenue >= 0 rule (if revenue present)."""
-    campaign = valid_base_campaign.copy()
-    campaign["revenue"] = revenue_value
+    campaign = {**valid_base_campaign, "revenue": revenue_value}
 
     result = validate_campaign_data(campaign)
 
     if should_fail:
         assert result["valid"] is False, f"Should fail for {description}"
-        assert any("revenue" in error.lower() and "negative" in error.lower()
-                   for error in result["errors"])
+        assert any(map(_NEGATIVE_REVENUE.search, result["errors"]))
     else:
         # Should not have revenue-related errors
-        revenue_errors = [e for e in result["errors"] if "revenue" in e.lower() and "negative" in e.lower()]
-        assert len(revenue_errors) == 0, f"Should accept {description}"
+        revenue_errors = [e for e in result["errors"] if _NEGATIVE_REVENUE.search(e)]
+        assert not revenue_errors, f"Should accept {description}"
 
 
-@pytest.mark.parametrize("impressions,clicks,should_fail,description", [
+_CLICKS_IMPRESSIONS_VALIDATION_CASES = (
     (1000, 1001, True, "clicks exceed impressions by 1"),
     (1000, 1500, True, "clicks exceed impressions by many"),
     (0, 100, True, "zero impressions but clicks exist"),
@@ -483,29 +536,29 @@ def test_revenue_validation(valid_base_campaign, revenue_value, should_fail, des
     (1000, 999, False, "clicks less than impressions"),
     (1000, 0, False, "zero clicks"),
     (0, 0, False, "zero impressions and zero clicks"),
-])
+)
+
+
+@pytest.mark.parametrize("impressions,clicks,should_fail,description", _CLICKS_IMPRESSIONS_VALIDATION_CASES,
+                         ids=_ids(_CLICKS_IMPRESSIONS_VALIDATION_CASES))
 def test_clicks_impressions_validation(valid_base_campaign, impressions, clicks, should_fail, description):
     """Test clicks <= impressions rule."""
-    campaign = valid_base_campaign.copy()
-    campaign["impressions"] = impressions
-    campaign["clicks"] = clicks
+    campaign = {**valid_base_campaign, "impressions": impressions, "clicks": clicks}
 
     result = validate_campaign_data(campaign)
 
     if should_fail:
         assert result["valid"] is False, f"Should fail when {description}"
-        assert any(("clicks" in error.lower() and "impressions" in error.lower()) or
-                   ("impressions" in error.lower() and "clicks" in error.lower())
-                   for error in result["errors"])
+        assert any(map(_IMPRESSIONS_AND_CLICKS.search, result["errors"]))
     else:
         # Should not have clicks/impressions relationship errors
-        relationship_errors = [e for e in result["errors"]
-                              if "clicks" in e.lower() and "impressions" in e.lower()
-                              and ("exceed" in e.lower() or "impossible" in e.lower())]
-        assert len(relationship_errors) == 0, f"Should accept when {description}"
+        relationship_errors = [e for e in map(str.lower, result["errors"])
+                               if "clicks" in e and "impressions" in e
+                               and ("exceed" in e or "impossible" in e)]
+        assert not relationship_errors, f"Should accept when {description}"
 
 
-@pytest.mark.parametrize("clicks,conversions,should_fail,description", [
+_CONVERSIONS_CLICKS_VALIDATION_CASES = (
     (100, 101, True, "conversions exceed clicks by 1"),
     (100, 200, True, "conversions exceed clicks by many"),
     (0, 10, True, "zero clicks but conversions exist"),
@@ -513,28 +566,28 @@ def test_clicks_impressions_validation(valid_base_campaign, impressions, clicks,
     (100, 99, False, "conversions less than clicks"),
     (100, 0, False, "zero conversions"),
     (0, 0, False, "zero clicks and zero conversions"),
-])
+)
+
+
+@pytest.mark.parametrize("clicks,conversions,should_fail,description", _CONVERSIONS_CLICKS_VALIDATION_CASES,
+                         ids=_ids(_CONVERSIONS_CLICKS_VALIDATION_CASES))
 def test_conversions_clicks_validation(valid_base_campaign, clicks, conversions, should_fail, description):
     """Test conversions <= clicks rule (if conversions present)."""
-    campaign = valid_base_campaign.copy()
-    campaign["clicks"] = clicks
-    campaign["conversions"] = conversions
+    campaign = {**valid_base_campaign, "clicks": clicks, "conversions": conversions}
 
     result = validate_campaign_data(campaign)
 
     if should_fail:
         assert result["valid"] is False, f"Should fail when {description}"
-        assert any("conversions" in error.lower() and "clicks" in error.lower()
-                   for error in result["errors"])
+        assert any(map(_CONVERSIONS_AND_CLICKS.search, result["errors"]))
     else:
         # Should not have conversions/clicks relationship errors
-        relationship_errors = [e for e in result["errors"]
-                              if "conversions" in e.lower() and "clicks" in e.lower()
-                              and "exceed" in e.lower()]
-        assert len(relationship_errors) == 0, f"Should accept when {description}"
+        relationship_errors = [e for e in map(str.lower, result["errors"])
+                               if "conversions" in e and "clicks" in e and "exceed" in e]
+        assert not relationship_errors, f"Should accept when {description}"
 
 
-@pytest.mark.parametrize("days_offset,should_fail,should_warn,description", [
+_DATE_VALIDATION_CASES = (
     (1, True, False, "1 day in future"),
     (5, True, False, "5 days in future"),
     (365, True, False, "1 year in future"),
@@ -546,39 +599,38 @@ def test_conversions_clicks_validation(valid_base_campaign, clicks, conversions,
     (-91, False, True, "91 days ago - should warn"),
     (-120, False, True, "120 days ago - should warn"),
     (-365, False, True, "1 year ago - should warn"),
-])
+)
+
+
+@pytest.mark.parametrize("days_offset,should_fail,should_warn,description", _DATE_VALIDATION_CASES,
+                         ids=_ids(_DATE_VALIDATION_CASES))
 def test_date_validation(valid_base_campaign, days_offset, should_fail, should_warn, description):
     """Test date not in future (error) and date not more than 90 days old (warning) rules."""
-    from datetime import datetime, timedelta
-
-    campaign = valid_base_campaign.copy()
-    test_date = (datetime.now() + timedelta(days=days_offset)).strftime("%Y-%m-%d")
-    campaign["date"] = test_date
+    test_date = _days_from_now(days_offset)
+    campaign = {**valid_base_campaign, "date": test_date}
 
-    result = validate_campaign_data(campaign)
+    result = validate_campaign_data(campaign, now=_NOW)
 
     if should_fail:
         assert result["valid"] is False, f"Should fail for date {description}"
-        assert any("date" in error.lower() and "future" in error.lower()
-                   for error in result["errors"])
+        assert any(map(_FUTURE_DATE.search, result["errors"]))
     else:
         # Should not have future date errors
-        future_errors = [e for e in result["errors"] if "date" in e.lower() and "future" in e.lower()]
-        assert len(future_errors) == 0, f"Should not fail for date {description}"
+        future_errors = [e for e in result["errors"] if _FUTURE_DATE.search(e)]
+        assert not future_errors, f"Should not fail for date {description}"
 
     if should_warn:
-        assert len(result["warnings"]) > 0, f"Should warn for date {description}"
-        assert any("date" in warning.lower() and "days" in warning.lower()
-                   for warning in result["warnings"])
+        assert result["warnings"], f"Should warn for date {description}"
+        assert any(map(_OLD_DATE.search, result["warnings"]))
     elif not should_fail:
         # Should not have old date warnings
-        old_date_warnings = [w for w in result["warnings"] if "date" in w.lower() and "days" in w.lower()]
-        assert len(old_date_warnings) == 0, f"Should not warn for date {description}"
+        old_date_warnings = [w for w in result["warnings"] if _OLD_DATE.search(w)]
+        assert not old_date_warnings, f"Should not warn for date {description}"
 
 
 # Data Type Validation Tests - Simple and Reusable Pattern
 
-@pytest.mark.parametrize("field,invalid_value,description", [
+_INVALID_DATA_TYPES_CASES = (
     # Numeric fields that should be float or int
     ("spend", "1000.00", "string instead of number"),
     ("spend", None, "None value"),
@@ -604,20 +656,23 @@ def test_date_validation(valid_base_campaign, days_offset, should_fail, should_w
     ("source", None, "None value"),
     ("date", 20241015, "int instead of string"),
     ("date", None, "None value"),
-])
+)
+
+
+@pytest.mark.parametrize("field,invalid_value,description", _INVALID_DATA_TYPES_CASES,
+                         ids=[f"{field}: {description}" for field, _, description in _INVALID_DATA_TYPES_CASES])
 def test_invalid_data_types(valid_base_campaign, field, invalid_value, description):
     """Test that invalid data types for any field cause validation to fail."""
-    campaign = valid_base_campaign.copy()
-    campaign[field] = invalid_value
+    campaign = {**valid_base_campaign, field: invalid_value}
 
     result = validate_campaign_data(campaign)
 
     assert result["valid"] is False, f"Should fail when {field} is {description}"
-    assert len(result["errors"]) > 0
+    assert result["errors"]
     assert any(field in error.lower() for error in result["errors"])
 
 
-@pytest.mark.parametrize("date_value,description", [
+_INVALID_DATE_FORMATS_CASES = (
     ("10/15/2024", "MM/DD/YYYY format"),
     ("15-10-2024", "DD-MM-YYYY format"),
     ("2024/10/15", "YYYY/MM/DD with slashes"),
@@ -627,20 +682,24 @@ def test_invalid_data_types(valid_base_campaign, field, invalid_value, descripti
     ("2024-10-32", "invalid day"),
     ("not-a-date", "invalid string"),
     ("", "empty string"),
-])
+    ("２０２４-１０-１５", "non-ASCII digits"),
+)
+
+
+@pytest.mark.parametrize("date_value,description", _INVALID_DATE_FORMATS_CASES,
+                         ids=_ids(_INVALID_DATE_FORMATS_CASES))
 def test_invalid_date_formats(valid_base_campaign, date_value, description):
     """Test that invalid date formats cause validation to fail."""
-    campaign = valid_base_campaign.copy()
-    campaign["date"] = date_value
+    campaign = {**valid_base_campaign, "date": date_value}
 
     result = validate_campaign_data(campaign)
 
     assert result["valid"] is False, f"Should fail for date: {description}"
-    assert len(result["errors"]) > 0
+    assert result["errors"]
     assert any("date" in error.lower() for error in result["errors"])
 
 
-@pytest.mark.parametrize("field,valid_value", [
+_VALID_DATA_TYPES_CASES = (
     # Both int and float should work for spend/revenue
     ("spend", 1000.0),
     ("spend", 1000),
@@ -656,17 +715,19 @@ def test_invalid_date_formats(valid_base_campaign, date_value, description):
     ("campaign_id", "camp_123"),
     ("source", "google_ads"),
     ("date", "2024-10-15"),
-])
+)
+
+
+@pytest.mark.parametrize("field,valid_value", _VALID_DATA_TYPES_CASES)
 def test_valid_data_types(valid_base_campaign, field, valid_value):
     """Test that valid data types are accepted."""
-    campaign = valid_base_campaign.copy()
-    campaign[field] = valid_value
+    campaign = {**valid_base_campaign, field: valid_value}
 
     result = validate_campaign_data(campaign)
 
     # Should not have type errors for this field
-    type_errors = [e for e in result["errors"] if field in e.lower() and "type" in e.lower() or "must be" in e.lower()]
-    assert len(type_errors) == 0, f"Should accept valid {field} value: {valid_value}"
+    type_errors = [e for e in map(str.lower, result["errors"]) if field in e and "type" in e or "must be" in e]
+    assert not type_errors, f"Should accept valid {field} value: {valid_value}"
 
 
 def test_validation_result_structure():
@@ -727,8 +788,174 @@ def test_docstring_example_invalid_campaign():
 
     assert result["valid"] is False
     # Check that errors mention both impressions and clicks
-    assert any("impressions" in error.lower() and "clicks" in error.lower()
-               for error in result["errors"])
+    assert any(map(_IMPRESSIONS_AND_CLICKS.search, result["errors"]))
+
+
+def test_source_specific_checks(valid_base_campaign, monkeypatch):
+    """Test that checks registered for a source only apply to that source."""
+    from src.functions import validateCampaignData as module
+
+    def require_customer_id(value, data):
+        return ("Missing required field: '{}'", ("customer_id",)) if value is module._MISSING else None
+
+    monkeypatch.setitem(module._SOURCE_CHECKS, "google_ads", [("customer_id", require_customer_id)])
+    caches = (module._field_checks, module._get_validator, module._validate_memoized)
+    for cache in caches:
+        cache.cache_clear()
+    try:
+        google = validate_campaign_data({**valid_base_campaign, "source": "google_ads"})
+        facebook = validate_campaign_data({**valid_base_campaign, "source": "facebook_ads"})
+    finally:
+        for cache in caches:
+            cache.cache_clear()
+
+    assert google["valid"] is False
+    assert any("customer_id" in error for error in google["errors"])
+    assert facebook["valid"] is True
+
+
+def test_validate_into_appends_to_caller_buffers(valid_base_campaign):
+    """Test that validate_into writes into reused buffers and matches validate_campaign_data."""
+    errors, warnings = [], []
+
+    for campaign in ({**valid_base_campaign, "clicks": 0}, {**valid_base_campaign, "spend": -1}):
+        errors.clear()
+        warnings.clear()
+        valid = validate_into(campaign, errors, warnings)
+        result = validate_campaign_data(campaign)
+
+        assert valid is result["valid"]
+        assert errors == result["errors"]
+        assert warnings == result["warnings"]
+
+
+def test_repeated_payloads_are_memoized(valid_base_campaign):
+    """Test that re-validating a payload gives an equal result with independent lists."""
+    campaign = {**valid_base_campaign, "clicks": 0}
+
+    first = validate_campaign_data(campaign)
+    first["warnings"].append("mutated by caller")
+    second = validate_campaign_data(dict(campaign))
+
+    assert second["warnings"] == [w for w in first["warnings"] if w != "mutated by caller"]
+    assert second["valid"] is first["valid"]
+
+
+def test_memoization_keeps_value_types_apart(valid_base_campaign):
+    """Test that equal-but-differently-typed values (1 vs True) are not served from one entry."""
+    assert validate_campaign_data({**valid_base_campaign, "clicks": 1})["valid"] is True
+    assert validate_campaign_data({**valid_base_campaign, "clicks": True})["valid"] is False
+
+
+def test_unhashable_payload_values_skip_the_cache(valid_base_campaign):
+    """Test that payloads with unhashable values are still validated."""
+    result = validate_campaign_data({**valid_base_campaign, "tags": ["summer"], "spend": [1000]})
+
+    assert result["valid"] is False
+    assert any("spend" in error.lower() for error in result["errors"])
+
+
+def test_reference_time_drives_date_rules(valid_base_campaign):
+    """Test that the date rules are evaluated against the supplied reference time."""
+    campaign = {**valid_base_campaign, "date": "2024-10-15"}
+    before = datetime(2024, 10, 1)
+    shortly_after = datetime(2024, 10, 20)
+    much_later = datetime(2025, 3, 1)
+
+    assert validate_campaign_data(campaign, now=before)["valid"] is False
+    assert validate_campaign_data(campaign, now=shortly_after)["warnings"] == []
+    assert any("days old" in w for w in validate_campaign_data(campaign, now=much_later)["warnings"])
+
+    errors, warnings = [], []
+    assert validate_into(campaign, errors, warnings, now=before) is False
 
 
+def test_validation_result_object(valid_base_campaign):
+    """Test that the ValidationResult object carries the same data as the dict result."""
+    invalid = {**valid_base_campaign, "spend": -1}
+    result = validate_campaign_result(invalid)
 
+    assert isinstance(result, ValidationResult)
+    assert result.valid is False
+    assert isinstance(result.errors, tuple) and result.warnings == ()
+    assert result.campaign_id == "camp_test"
+
+    as_dict = result.as_dict()
+    expected = validate_campaign_data(invalid)
+    assert {k: v for k, v in as_dict.items() if k != "validated_at"} == \
+        {k: v for k, v in expected.items() if k != "validated_at"}
+    with pytest.raises(AttributeError):
+        result.valid = True
+
+
+def test_missing_fields_skip_value_checks(valid_base_campaign):
+    """Test that a missing required field stops validation before the value checks."""
+    campaign = {**valid_base_campaign, "spend": "1000.00"}
+    del campaign["clicks"]
+
+    result = validate_campaign_data(campaign)
+
+    assert result["valid"] is False
+    assert result["errors"] == ["Missing required field: 'clicks'"]
+    assert result["warnings"] == []
+
+
+def test_null_optional_metrics_are_reported_alone(valid_base_campaign):
+    """Test that None for revenue/conversions gives only the null messages, even with other errors."""
+    campaign = {**valid_base_campaign, "spend": "1000.00", "revenue": None, "conversions": None}
+    del campaign["clicks"]
+
+    result = validate_campaign_data(campaign)
+
+    assert result["valid"] is False
+    assert result["errors"] == [
+        "Field 'revenue' must be a number (float or int), got NoneType",
+        "Field 'conversions' must be an integer, got NoneType",
+    ]
+
+
+def test_pydantic_model_applies_the_same_rules(valid_base_campaign):
+    """Test that the CampaignData model enforces the compiled rules and warnings too."""
+    model = CampaignData(**{**valid_base_campaign, "conversions": 10})
+    assert model.get_warnings() == validate_campaign_data({**valid_base_campaign, "conversions": 10})["warnings"]
+
+    with pytest.raises(ValueError, match="cannot exceed"):
+        CampaignData(**{**valid_base_campaign, "clicks": 20000})
+
+
+_VERDICT_CASES = (
+    ({}, "valid campaign"),
+    ({"spend": -1}, "negative spend"),
+    ({"spend": "1000"}, "string spend"),
+    ({"clicks": 20000}, "clicks exceed impressions"),
+    ({"impressions": 100, "clicks": 60}, "CTR above limit"),
+    ({"spend": 150000.0}, "warning only"),
+    ({"date": "2024-13-01"}, "invalid date"),
+    ({"campaign_id": None}, "null required field"),
+)
+
+
+@pytest.mark.parametrize("overrides,description", _VERDICT_CASES,
+                         ids=_ids(_VERDICT_CASES))
+def test_campaign_is_valid_matches_full_validation(valid_base_campaign, overrides, description):
+    """Test that the message-free verdict agrees with validate_campaign_data."""
+    campaign = {**valid_base_campaign, **overrides}
+
+    assert campaign_is_valid(campaign) is validate_campaign_data(campaign)["valid"], description
+
+
+_SOURCE_WARNING_CASES = (
+    ("google_ads", False),
+    ("shopify", False),
+    ("myspace_ads", True),
+    ("Google_Ads", True),
+)
+
+
+@pytest.mark.parametrize("source,should_warn", _SOURCE_WARNING_CASES)
+def test_unknown_source_warning(valid_base_campaign, source, should_warn):
+    """Test that sources outside the known platforms are flagged but stay valid."""
+    result = validate_campaign_data({**valid_base_campaign, "source": source})
+
+    assert result["valid"] is True
+    assert any("unknown source" in w.lower() for w in result["warnings"]) is should_warn